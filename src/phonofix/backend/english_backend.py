@@ -11,6 +11,7 @@ import time
 import traceback
 import warnings
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Literal, Optional
 
 from phonofix.languages.english import ENGLISH_INSTALL_HINT
@@ -181,17 +182,10 @@ def _cached_ipa_convert(text: str) -> str:
     return result
 
 
-def _normalize_english_text_for_ipa(text: str) -> str:
-    """
-    英文 IPA 轉換前的輕量正規化（用於 token/canonical 對齊）
-
-    目標：讓縮寫/數字在 batch IPA 場景下也能與 phonetic matching 對齊，避免過度依賴 surface variants。
-    """
-    if not text:
-        return ""
-
-    # 常見縮寫（小寫）
-    common_abbreviations = {
+# 常見縮寫（小寫）：以字母逐一發音（js -> J S）
+# 模組層級常數，避免每次正規化都重建集合
+_COMMON_ABBREVIATIONS = frozenset(
+    {
         "js",
         "ts",
         "py",
@@ -212,29 +206,47 @@ def _normalize_english_text_for_ipa(text: str) -> str:
         "aws",
         "gcp",
     }
+)
+
+# 數字展開對照表（單一字元 -> 英文讀法），以單次 translate 取代逐一 replace
+_DIGIT_WORDS_TABLE = str.maketrans(
+    {
+        "0": "zero ",
+        "1": "one ",
+        "2": "two ",
+        "3": "three ",
+        "4": "four ",
+        "5": "five ",
+        "6": "six ",
+        "7": "seven ",
+        "8": "eight ",
+        "9": "nine ",
+    }
+)
+
+
+@lru_cache(maxsize=50000)
+def _normalize_english_text_for_ipa(text: str) -> str:
+    """
+    英文 IPA 轉換前的輕量正規化（用於 token/canonical 對齊）
+
+    目標：讓縮寫/數字在 batch IPA 場景下也能與 phonetic matching 對齊，避免過度依賴 surface variants。
+    純函數（同輸入同輸出），以 lru_cache 共用結果；correct() 時每個 window 都會經過這裡。
+    """
+    if not text:
+        return ""
 
     normalized = text
 
     # 全大寫短詞：視為字母縮寫（AWS -> A W S）
     if normalized.isupper() and len(normalized) <= 5 and normalized.isalpha():
-        normalized = " ".join(list(normalized))
+        normalized = " ".join(normalized)
     # 常見小寫縮寫：轉為大寫字母發音（js -> J S）
-    elif normalized.lower() in common_abbreviations and normalized.isalpha():
-        normalized = " ".join(list(normalized.upper()))
+    elif normalized.lower() in _COMMON_ABBREVIATIONS and normalized.isalpha():
+        normalized = " ".join(normalized.upper())
 
     # 數字簡單展開（避免 1kg / 3d 類案例直接進 phonemizer）
-    normalized = (
-        normalized.replace("0", "zero ")
-        .replace("1", "one ")
-        .replace("2", "two ")
-        .replace("3", "three ")
-        .replace("4", "four ")
-        .replace("5", "five ")
-        .replace("6", "six ")
-        .replace("7", "seven ")
-        .replace("8", "eight ")
-        .replace("9", "nine ")
-    )
+    normalized = normalized.translate(_DIGIT_WORDS_TABLE)
 
     return normalized
 
@@ -454,7 +466,7 @@ class EnglishPhoneticBackend(PhoneticBackend):
 
         normalized = [_normalize_english_text_for_ipa(t) for t in texts]
         normalized_map = _batch_ipa_convert(normalized)
-        return {orig: normalized_map.get(_normalize_english_text_for_ipa(orig), "") for orig in texts}
+        return {orig: normalized_map.get(norm, "") for orig, norm in zip(texts, normalized)}
 
     def get_cache_stats(self) -> BackendStats:
         """
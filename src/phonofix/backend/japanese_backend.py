@@ -24,16 +24,9 @@ _fugashi_tagger: Optional[Any] = None
 _init_lock = threading.Lock()
 
 
-def _strip_macrons(text: str) -> str:
-    """
-    移除羅馬字長音符號（macrons）。
-
-    說明：
-    - cutlet 產出的 romaji 可能包含 ā/ī/ū/ē/ō 等長音符號
-    - 我們在 phonetic key 層面希望維持「只含 ASCII」的可比對字串
-      （避免環境/輸入法導致同一讀音出現多種 Unicode 表示）
-    """
-    macrons = {
+# 長音符號（macrons）對照表：皆為單一字元替換，模組載入時建立一次
+_MACRON_TABLE = str.maketrans(
+    {
         "ā": "a",
         "ī": "i",
         "ū": "u",
@@ -45,9 +38,19 @@ def _strip_macrons(text: str) -> str:
         "ê": "e",
         "ô": "o",
     }
-    for m, p in macrons.items():
-        text = text.replace(m, p)
-    return text
+)
+
+
+def _strip_macrons(text: str) -> str:
+    """
+    移除羅馬字長音符號（macrons）。
+
+    說明：
+    - cutlet 產出的 romaji 可能包含 ā/ī/ū/ē/ō 等長音符號
+    - 我們在 phonetic key 層面希望維持「只含 ASCII」的可比對字串
+      （避免環境/輸入法導致同一讀音出現多種 Unicode 表示）
+    """
+    return text.translate(_MACRON_TABLE)
 
 
 def _get_cutlet() -> Any:
@@ -146,7 +146,8 @@ class PipelineCorrectorBase(ABC):
         5) 去衝突
         6) 套用替換
         """
-        if not text:
+        # 空字串/純空白不可能命中任何詞彙，直接返回（不建立遮罩、不觸發 G2P）
+        if not text or text.isspace():
             return text
 
         with TimingContext(self._pipeline_name, self._logger, logging.DEBUG):
@@ -143,6 +143,7 @@ def process_fuzzy_match_draft(
         target_pinyin_str=item["pinyin_str"],
         segment_syllables=segment_syllables or backend.get_pinyin_syllables(original_segment),
         target_syllables=item.get("pinyin_syllables"),
+        max_error_ratio=threshold,
     )
     # 目前 drafts 不需要 window_pinyin_str；保留回傳值以避免未來要 trace/debug 時再改簽名
     if is_fuzzy_match:
@@ -207,9 +208,8 @@ def generate_fuzzy_candidate_drafts(
             first = segment_initials[0] if segment_initials else ""
             group = config.FUZZY_INITIALS_MAP.get(first) or first or ""
 
-            items = list(groups.get(group, []))
-            if group == "":
-                items = list(groups.get("", []))
+            # 直接使用 bucket 內的 list（唯讀迭代），不為每個 window 複製
+            items = groups.get(group)
             if not items:
                 continue
 
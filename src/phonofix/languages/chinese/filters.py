@@ -18,6 +18,9 @@ from typing import Any
 
 from phonofix.utils.aho_corasick import AhoCorasick
 
+# 有效片段只允許中文、英文、數字；預先編譯以供每個 window 重複使用
+_INVALID_SEGMENT_CHAR_RE = re.compile(r"[^a-zA-Z0-9\u4e00-\u9fff]")
+
 
 def check_context_bonus(
     *,
@@ -115,7 +118,7 @@ def is_span_protected(*, start: int, end: int, protected_indices: set[int]) -> b
 
 def is_valid_segment(*, segment: str) -> bool:
     """檢查片段是否包含有效字符 (中文、英文、數字)"""
-    if re.search(r"[^a-zA-Z0-9\u4e00-\u9fff]", segment):
+    if _INVALID_SEGMENT_CHAR_RE.search(segment):
         return False
     return True
 
@@ -9,6 +9,8 @@
 
 from __future__ import annotations
 
+import heapq
+
 from phonofix.backend import ChinesePhoneticBackend, get_chinese_backend
 from phonofix.core.protocols.fuzzy import FuzzyGeneratorProtocol
 
@@ -161,9 +163,11 @@ class ChineseFuzzyGenerator(FuzzyGeneratorProtocol):
                 {"pinyin": "zong", "char": "宗"}  (假設 z/zh 模糊)
             ]
         """
+        # 非中文字符直接返回原樣（先做便宜的區段判斷，再查拼音）
+        if not ('\u4e00' <= char <= '\u9fff'):
+            return [{"pinyin": char, "char": char}]
         base_pinyin = self._pinyin_string(char)
-        # 非中文字符直接返回原樣
-        if not base_pinyin or not ('\u4e00' <= char <= '\u9fff'):
+        if not base_pinyin:
             return [{"pinyin": char, "char": char}]
 
         # 生成所有可能的模糊拼音
@@ -226,11 +230,12 @@ class ChineseFuzzyGenerator(FuzzyGeneratorProtocol):
 
             # 控制狀態數量（依變更數/長度/字典序做穩定裁剪）
             if len(next_states) > self.max_phonetic_states:
-                ranked = sorted(
+                ranked = heapq.nsmallest(
+                    self.max_phonetic_states,
                     next_states.items(),
                     key=lambda kv: (kv[1][1], len(kv[1][0]), kv[1][0], kv[0]),
                 )
-                next_states = dict(ranked[: self.max_phonetic_states])
+                next_states = dict(ranked)
 
             states = next_states
 
@@ -257,7 +262,7 @@ class ChineseFuzzyGenerator(FuzzyGeneratorProtocol):
         """
         if term in self.config.STICKY_PHRASE_MAP:
             # 取得目前已有的變體文字，避免重複
-            alias_texts = [a if isinstance(a, str) else a.get("text", "") for a in aliases]
+            alias_texts = {a if isinstance(a, str) else a.get("text", "") for a in aliases}
 
             for sticky in self.config.STICKY_PHRASE_MAP[term]:
                 if sticky not in alias_texts:
@@ -266,6 +271,7 @@ class ChineseFuzzyGenerator(FuzzyGeneratorProtocol):
                     # 若 aliases 是 dict 列表 (舊版邏輯)，則 append dict
                     # 這裡配合 generate_fuzzy_variants 返回字串列表的邏輯
                     aliases.append(sticky)
+                    alias_texts.add(sticky)
 
     def generate_variants(self, term: str, max_variants: int = 30):
         """
@@ -278,7 +284,7 @@ class ChineseFuzzyGenerator(FuzzyGeneratorProtocol):
         Returns:
             List[str]: 變體列表（不包含原詞）
         """
-        if not term:
+        if not term or term.isspace():
             return []
 
         variants: list[str] = []
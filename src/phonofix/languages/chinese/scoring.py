@@ -48,6 +48,7 @@ def calculate_pinyin_similarity(
     target_pinyin_str: str,
     segment_syllables: tuple[str, ...] | None = None,
     target_syllables: tuple[str, ...] | None = None,
+    max_error_ratio: float | None = None,
 ) -> tuple[str, float, bool]:
     """
     計算拼音相似度
@@ -57,6 +58,10 @@ def calculate_pinyin_similarity(
     2. 韻母模糊匹配 (如 in <-> ing)
     3. Levenshtein 編輯距離
 
+    Args:
+        max_error_ratio: 呼叫端的容錯上限（可選）。提供時 Levenshtein 以 score_cutoff 提早結束；
+            超過上限時回傳的錯誤率只保證「大於上限」，不再是精確值。
+
     Returns:
         (str, float, bool): (視窗拼音字串, 錯誤率, 是否為模糊匹配)
 
@@ -100,8 +105,12 @@ def calculate_pinyin_similarity(
         return window_pinyin_str, 0.1, True
 
     # Levenshtein 編輯距離
-    dist = Levenshtein.distance(window_pinyin_str, target_pinyin_lower)
     max_len = max(len(window_pinyin_str), len(target_pinyin_lower))
+    score_cutoff = None
+    if max_error_ratio is not None:
+        # +1 作為浮點誤差緩衝：cutoff 內的距離皆為精確值，超過時 ratio 必定大於上限
+        score_cutoff = int(max_error_ratio * max_len) + 1
+    dist = Levenshtein.distance(window_pinyin_str, target_pinyin_lower, score_cutoff=score_cutoff)
     error_ratio = dist / max_len if max_len > 0 else 0.0
     return window_pinyin_str, float(error_ratio), False
 
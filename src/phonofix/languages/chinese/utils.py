@@ -12,6 +12,13 @@ from phonofix.backend import ChinesePhoneticBackend, get_chinese_backend
 
 from .config import ChinesePhoneticConfig
 
+# 聲母集合（雙字符聲母需優先判斷，故分開存放）
+_TWO_CHAR_INITIALS = frozenset({"zh", "ch", "sh"})
+_SINGLE_CHAR_INITIALS = frozenset("bpmfdtnlgkhjqxzcsryw")
+
+_ENGLISH_LETTER_RE = re.compile(r"[a-zA-Z]")
+
+
 class ChinesePhoneticUtils:
     """
     中文語音工具類別
@@ -46,7 +53,7 @@ class ChinesePhoneticUtils:
         用途：
         - 中文文本常混入英文縮寫（例如 ICU、PCN），某些規則需要先做分流或跳過
         """
-        return bool(re.search(r"[a-zA-Z]", text))
+        return _ENGLISH_LETTER_RE.search(text) is not None
 
     def get_pinyin_string(self, text: str) -> str:
         """取得文本的拼音字串（無聲調、小寫，委派給 backend 快取）。"""
@@ -66,17 +73,11 @@ class ChinesePhoneticUtils:
         """
         if not pinyin_str:
             return "", ""
-        # 聲母列表 (注意順序: 雙字符聲母優先匹配)
-        initials = [
-            'zh', 'ch', 'sh',
-            'b', 'p', 'm', 'f', 'd', 't', 'n', 'l',
-            'g', 'k', 'h', 'j', 'q', 'x',
-            'z', 'c', 's', 'r', 'y', 'w'
-        ]
-        for initial in initials:
-            if pinyin_str.startswith(initial):
-                final = pinyin_str[len(initial):]
-                return initial, final
+        # 雙字符聲母優先匹配（zh/ch/sh），其次單字符聲母
+        if pinyin_str[:2] in _TWO_CHAR_INITIALS:
+            return pinyin_str[:2], pinyin_str[2:]
+        if pinyin_str[0] in _SINGLE_CHAR_INITIALS:
+            return pinyin_str[0], pinyin_str[1:]
         # 若無匹配聲母，則視為零聲母，整個字串為韻母
         return "", pinyin_str
 
@@ -11,6 +11,7 @@
 
 from __future__ import annotations
 
+from itertools import chain
 from typing import Any
 
 from . import indexing as indexing_ops
@@ -145,10 +146,12 @@ def generate_fuzzy_candidate_drafts(
             window_group_key = -1 if window_first_group is None else int(window_first_group)
 
             # 只看同群組 + unknown 群組；視窗首音未知時保守掃描所有群組
-            items = list(groups.get(window_group_key, [])) + list(groups.get(-1, []))
+            # 直接迭代 bucket 內的 list，不為每個 window 複製/串接一份新的 items
             if window_group_key == -1:
                 # 視窗首音素未知時，保守：檢查所有群組
-                items = [it for bucket in groups.values() for it in bucket]
+                items = chain.from_iterable(groups.values())
+            else:
+                items = chain(groups.get(window_group_key, ()), groups.get(-1, ()))
 
             for item in items:
                 # 長度差上限 pruning：避免拿非常不可能的 item 進 similarity
@@ -5,7 +5,8 @@
 並提供工廠方法建立輕量的 EnglishCorrector 實例。
 """
 
-from typing import Any, Callable, Dict, Optional
+import logging
+from typing import Any, Callable, Dict, List, Optional
 
 from phonofix.backend import EnglishPhoneticBackend, get_english_backend
 from phonofix.core.engine_interface import CorrectorEngine
@@ -128,9 +129,12 @@ class EnglishEngine(CorrectorEngine):
             protected_set = set(protected_terms) if protected_terms else None
             normalized_input = normalize_term_dict(term_dict)
 
+            term_values = {term: self._coerce_term_value(value) for term, value in normalized_input.items()}
+            auto_variants = self._generate_auto_variants(term_values) if self._enable_surface_variants else {}
+
             normalized_dict = {}
-            for term, value in normalized_input.items():
-                normalized_value = self._normalize_term_value(term, value)
+            for term, value in term_values.items():
+                normalized_value = self._normalize_term_value(term, value, auto_variants.get(term, []))
                 if normalized_value:
                     normalized_dict[term] = normalized_value
 
@@ -151,39 +155,66 @@ class EnglishEngine(CorrectorEngine):
                 on_event=on_event,
             )
 
-    def _normalize_term_value(self, term: str, value: Any) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _coerce_term_value(value: Any) -> Dict[str, Any]:
         """
-        將 term_dict 的 value 正規化為 internal config dict。
-
-        主要工作：
-        - 統一 aliases / keywords / exclude_when / weight 欄位
-        - 產生 auto surface variants（可由 enable_surface_variants 控制）
-        - 以 IPA 去重 aliases，避免字典膨脹（同音不同寫只留一份）
+        將 term_dict 的 value 統一為含 aliases 欄位的 dict（list 視為 aliases；其他型別視為無 aliases）。
         """
         if isinstance(value, list):
-            value = {"aliases": value}
-        elif isinstance(value, dict):
+            return {"aliases": value}
+        if isinstance(value, dict):
             if "aliases" not in value:
-                value = {**value, "aliases": []}
-        else:
-            value = {"aliases": []}
+                return {**value, "aliases": []}
+            return value
+        return {"aliases": []}
+
+    @staticmethod
+    def _max_variants(value: Dict[str, Any]) -> int:
+        """取得單一詞彙的 max_variants（未設定或為 0/None 時使用預設 30）。"""
+        return int(value.get("max_variants", 30) or 30)
+
+    def _generate_auto_variants(self, term_values: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+        """
+        批次產生所有詞彙的 auto surface variants。
 
-        ipa = self._backend.to_phonetic(term)
-        self._logger.debug(f"  [IPA] {term} -> {ipa}")
+        - 依各詞彙的 max_variants 分組，每組呼叫一次 generate_variants_batch
+        - 整組候選只做一次 IPA 批次轉換，而不是每個詞彙各轉一次
+        """
+        terms_by_limit: Dict[int, List[str]] = {}
+        for term, value in term_values.items():
+            terms_by_limit.setdefault(self._max_variants(value), []).append(term)
+
+        auto_variants: Dict[str, List[str]] = {}
+        for limit, terms in terms_by_limit.items():
+            with self._log_timing(f"generate_variants_batch({len(terms)} terms)"):
+                auto_variants.update(self._fuzzy_generator.generate_variants_batch(terms, max_variants=limit))
+        return auto_variants
+
+    def _normalize_term_value(
+        self, term: str, value: Dict[str, Any], auto_variants: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        將已統一格式的 term value（見 `_coerce_term_value`）正規化為 internal config dict。
 
-        if self._enable_surface_variants:
-            max_variants = int(value.get("max_variants", 30) or 30)
-            with self._log_timing(f"generate_variants({term})"):
-                auto_variants = self._fuzzy_generator.generate_variants(term, max_variants=max_variants)
+        主要工作：
+        - 統一 aliases / keywords / exclude_when / weight 欄位
+        - 併入 auto surface variants（由 create_corrector 批次產生，可由 enable_surface_variants 控制）
+        - 以 IPA 去重 aliases，避免字典膨脹（同音不同寫只留一份）
+        """
+        # canonical 的 IPA 只用於 debug 日誌；未開啟 debug 時不另外觸發一次 G2P，
+        # 讓 IPA 轉換集中在 generate_variants_batch / alias 去重的批次呼叫中完成。
+        if self._logger.isEnabledFor(logging.DEBUG):
+            ipa = self._backend.to_phonetic(term)
+            self._logger.debug(f"  [IPA] {term} -> {ipa}")
 
+        if auto_variants:
             current_aliases = set(value["aliases"])
             for variant in auto_variants:
                 if variant != term and variant not in current_aliases:
                     value["aliases"].append(variant)
                     current_aliases.add(variant)
 
-        max_variants = int(value.get("max_variants", 30) or 30)
-        value["aliases"] = self._filter_aliases_by_phonetic(value["aliases"])[:max_variants]
+        value["aliases"] = self._filter_aliases_by_phonetic(value["aliases"])[: self._max_variants(value)]
 
         if value["aliases"]:
             self._logger.debug(
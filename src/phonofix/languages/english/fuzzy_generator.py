@@ -12,17 +12,23 @@
 
 from __future__ import annotations
 
+import heapq
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from phonofix.backend import EnglishPhoneticBackend, get_english_backend
 from phonofix.core.protocols.fuzzy import FuzzyGeneratorProtocol
 
 from .config import EnglishPhoneticConfig
 
+# surface variants 用的正則（模組層級預先編譯，避免每次生成都查詢 re 快取）
+_SEPARATOR_RE = re.compile(r"[\\._\\-]+")
+_CAMEL_PARTS_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z]|\\d|$)|[A-Z]?[a-z]+|\\d+")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class _Candidate:
     """
     內部候選資料結構（用於 variants 去重與排序）。
@@ -68,6 +74,9 @@ class EnglishFuzzyGenerator(FuzzyGeneratorProtocol):
         self.config = config or EnglishPhoneticConfig
         self._backend = backend
         self.enable_representative_variants = enable_representative_variants
+        self._spelling_patterns = [
+            (re.compile(pattern), replacement) for pattern, replacement in self.config.SPELLING_PATTERNS
+        ]
 
     def generate_variants(self, term: str, max_variants: int = 30) -> List[str]:
         """
@@ -78,12 +87,57 @@ class EnglishFuzzyGenerator(FuzzyGeneratorProtocol):
         - 若 enable_representative_variants 開啟，追加較激進的單步替換（避免爆炸）
         - 生成階段以 IPA 去重（同 IPA 只保留成本最低/字典序穩定的代表）
         """
-        if not term:
-            return []
+        return self.generate_variants_batch([term], max_variants=max_variants).get(term, [])
+
+    def generate_variants_batch(self, terms: Iterable[str], max_variants: int = 30) -> Dict[str, List[str]]:
+        """
+        批次為多個詞彙生成英文模糊變體。
 
+        每個詞彙的結果與 `generate_variants(term, max_variants)` 相同；差別在於
+        所有詞彙的候選只呼叫一次 `backend.to_phonetic_batch()`（phonemizer 一次處理整批），
+        不必每個詞彙各自啟動一次 IPA 轉換。
+
+        Returns:
+            Dict[str, List[str]]: 詞彙 -> 變體列表
+        """
         max_variants = max(0, int(max_variants))
-        if max_variants == 0:
-            return []
+
+        results: Dict[str, List[str]] = {}
+        pending: Dict[str, Dict[str, int]] = {}
+        for term in terms:
+            if term in results or term in pending:
+                continue
+            by_text = self._collect_candidates(term) if max_variants else {}
+            if by_text:
+                pending[term] = by_text
+            else:
+                results[term] = []
+
+        if not pending:
+            return results
+
+        backend = self._backend or self._try_get_backend()
+        if backend is None or not backend.is_initialized():
+            for term, by_text in pending.items():
+                ranked = heapq.nsmallest(max_variants, by_text.items(), key=lambda v: (v[1], len(v[0]), v[0]))
+                results[term] = [t for (t, _) in ranked]
+            return results
+
+        # 所有詞彙的候選合併成一次批次 IPA 轉換（重複拼寫只送一次）
+        texts = list(dict.fromkeys(chain.from_iterable(pending.values())))
+        ipa_map = backend.to_phonetic_batch(texts)
+        for term, by_text in pending.items():
+            results[term] = self._rank_by_ipa(by_text, ipa_map, max_variants)
+        return results
+
+    def _collect_candidates(self, term: str) -> Dict[str, int]:
+        """
+        產生單一詞彙的候選並做 surface 去重（同拼寫保留最低成本；排除原詞與空值）。
+
+        回傳 text -> cost；後續排序直接使用這個 dict，不再轉回 _Candidate 物件。
+        """
+        if not term or term.isspace():
+            return {}
 
         candidates: list[_Candidate] = []
         candidates.extend(self._generate_safe_surface_variants(term))
@@ -91,7 +145,6 @@ class EnglishFuzzyGenerator(FuzzyGeneratorProtocol):
         if self.enable_representative_variants:
             candidates.extend(self._generate_representative_spelling_variants(term))
 
-        # 移除原詞與空值，先做 surface 去重（保留最低成本）
         by_text: dict[str, int] = {}
         for cand in candidates:
             text = cand.text
@@ -101,29 +154,25 @@ class EnglishFuzzyGenerator(FuzzyGeneratorProtocol):
             if prev is None or cand.cost < prev:
                 by_text[text] = cand.cost
 
-        if not by_text:
-            return []
-
-        deduped = [_Candidate(text=t, cost=c) for t, c in by_text.items()]
+        return by_text
 
-        backend = self._backend or self._try_get_backend()
-        if backend is None or not backend.is_initialized():
-            ranked = sorted(deduped, key=lambda c: (c.cost, len(c.text), c.text))
-            return [c.text for c in ranked][:max_variants]
-
-        # 生成階段即以 IPA 去重：同 IPA 只保留成本最低的代表
-        ipa_map = backend.to_phonetic_batch([c.text for c in deduped])
+    @staticmethod
+    def _rank_by_ipa(by_text: Dict[str, int], ipa_map: Dict[str, str], max_variants: int) -> List[str]:
+        """
+        以 IPA 去重並排序：同 IPA 只保留成本最低的代表，取前 max_variants 名。
+        """
         by_ipa: dict[str, Tuple[str, int]] = {}
-        for cand in deduped:
-            ipa = (ipa_map.get(cand.text) or "").replace(" ", "")
+        for text, cost in by_text.items():
+            ipa = (ipa_map.get(text) or "").replace(" ", "")
             if not ipa:
                 continue
             prev = by_ipa.get(ipa)
-            if prev is None or cand.cost < prev[1] or (cand.cost == prev[1] and cand.text < prev[0]):
-                by_ipa[ipa] = (cand.text, cand.cost)
+            if prev is None or cost < prev[1] or (cost == prev[1] and text < prev[0]):
+                by_ipa[ipa] = (text, cost)
 
-        ranked = sorted(by_ipa.values(), key=lambda v: (v[1], len(v[0]), v[0]))
-        return [t for (t, _) in ranked][:max_variants]
+        # 只需要前 max_variants 名：以 nsmallest 取 top-k（結果與 sorted()[:k] 相同）
+        ranked = heapq.nsmallest(max_variants, by_ipa.values(), key=lambda v: (v[1], len(v[0]), v[0]))
+        return [t for (t, _) in ranked]
 
     def _try_get_backend(self) -> Optional[EnglishPhoneticBackend]:
         """
@@ -152,9 +201,9 @@ class EnglishFuzzyGenerator(FuzzyGeneratorProtocol):
         out.append(_Candidate(term.lower(), 1))
 
         # 2) 符號/分隔：Vue.js / Node-js / foo_bar
-        if re.search(r"[\\._\\-]", term):
-            spaced = re.sub(r"[\\._\\-]+", " ", term).strip()
-            compact = re.sub(r"[\\._\\-]+", "", term)
+        if _SEPARATOR_RE.search(term):
+            spaced = _SEPARATOR_RE.sub(" ", term).strip()
+            compact = _SEPARATOR_RE.sub("", term)
             if spaced and spaced != term:
                 out.append(_Candidate(spaced, 1))
                 out.append(_Candidate(spaced.lower(), 2))
@@ -163,7 +212,7 @@ class EnglishFuzzyGenerator(FuzzyGeneratorProtocol):
                 out.append(_Candidate(compact.lower(), 2))
 
         # 3) CamelCase：TensorFlow -> Tensor Flow
-        parts = re.findall(r"[A-Z]+(?=[A-Z][a-z]|\\d|$)|[A-Z]?[a-z]+|\\d+", term)
+        parts = _CAMEL_PARTS_RE.findall(term)
         if len(parts) >= 2:
             spaced = " ".join(parts)
             out.append(_Candidate(spaced, 1))
@@ -171,10 +220,10 @@ class EnglishFuzzyGenerator(FuzzyGeneratorProtocol):
 
         # 4) 短縮寫：AWS -> A W S
         if term.isalpha() and term.isupper() and len(term) <= 6:
-            letters = " ".join(list(term))
+            letters = " ".join(term)
             out.append(_Candidate(letters, 1))
             out.append(_Candidate(letters.lower(), 2))
-            out.append(_Candidate(".".join(list(term)) + ".", 2))
+            out.append(_Candidate(".".join(term) + ".", 2))
 
         return out
 
@@ -190,11 +239,10 @@ class EnglishFuzzyGenerator(FuzzyGeneratorProtocol):
         lower = term.lower()
 
         # 1) 常見拼寫模式（偏 aggressive；只做單步替換避免爆炸）
-        for pattern, replacement in self.config.SPELLING_PATTERNS:
-            if re.search(pattern, lower):
-                v = re.sub(pattern, replacement, lower, count=1)
-                if v and v != lower:
-                    out.append(_Candidate(v, 3))
+        for pattern, replacement in self._spelling_patterns:
+            v, n = pattern.subn(replacement, lower, count=1)
+            if n and v and v != lower:
+                out.append(_Candidate(v, 3))
 
         # 2) 字母/數字音似混淆：單一位置替換
         for i, ch in enumerate(term):
@@ -19,6 +19,27 @@ from phonofix.core.phonetic_interface import PhoneticSystem
 from .config import EnglishPhoneticConfig
 
 
+def _build_phoneme_group_table() -> dict[int, str]:
+    """
+    建立「IPA 字元 -> 音素群組代碼」的 str.translate 對照表。
+
+    - 同一字元出現在多個群組時，以第一個群組為準（與逐群組掃描的語意一致）
+    - 代碼依群組順序為 A/B/C...
+    """
+    table: dict[int, str] = {}
+    for idx, group in enumerate(EnglishPhoneticConfig.FUZZY_PHONEME_GROUPS):
+        code = chr(ord("A") + idx)
+        for ch in group:
+            table.setdefault(ord(ch), code)
+    return table
+
+
+_PHONEME_GROUP_TABLE = _build_phoneme_group_table()
+
+# 距離計算前的 IPA 正規化（皆為單一字元替換/刪除，可用單次 translate 完成）
+_IPA_DISTANCE_TABLE = str.maketrans({" ": None, "ː": None, "ɚ": "ə", "ɝ": "ə", "ɡ": "g"})
+
+
 class EnglishPhoneticSystem(PhoneticSystem):
     """
     英文發音系統（IPA distance / fuzzy match）
@@ -83,17 +104,20 @@ class EnglishPhoneticSystem(PhoneticSystem):
 
         ratio_raw = Levenshtein.distance(raw1, raw2) / max_len
 
+        # 群組/骨架距離只在「比目前最佳更低」時才有意義，
+        # 因此以目前最佳 ratio 當作上界做 bounded Levenshtein（超過上界即提早結束）。
         g1 = self._map_to_phoneme_groups(raw1)
         g2 = self._map_to_phoneme_groups(raw2)
         g_max = max(len(g1), len(g2))
-        ratio_group = Levenshtein.distance(g1, g2) / g_max if g_max else ratio_raw
+        ratio_group = self._bounded_ratio(g1, g2, g_max, ratio_raw) if g_max else ratio_raw
 
         c1 = self._consonant_skeleton(raw1)
         c2 = self._consonant_skeleton(raw2)
         c_max = max(len(c1), len(c2))
-        ratio_cons = Levenshtein.distance(c1, c2) / c_max if c_max >= 4 else 1.0
+        best = min(ratio_raw, ratio_group)
+        ratio_cons = self._bounded_ratio(c1, c2, c_max, best) if c_max >= 4 else 1.0
 
-        error_ratio = min(ratio_raw, ratio_group, ratio_cons)
+        error_ratio = min(best, ratio_cons)
         tolerance = self.get_tolerance(max_len)
 
         if raw1 and raw2 and not self._are_first_phonemes_similar(raw1, raw2):
@@ -101,6 +125,18 @@ class EnglishPhoneticSystem(PhoneticSystem):
 
         return error_ratio, error_ratio <= tolerance
 
+    @staticmethod
+    def _bounded_ratio(s1: str, s2: str, denom: int, bound: float) -> float:
+        """
+        計算 `distance / denom`，但只在結果可能低於 `bound` 時才算出精確值。
+
+        - 以 `score_cutoff` 讓 Levenshtein 在距離超過上界時提早結束
+        - 超過上界時直接回傳 `bound`（呼叫端只取 min，結果與完整計算一致）
+        """
+        cutoff = int(bound * denom)
+        dist = Levenshtein.distance(s1, s2, score_cutoff=cutoff)
+        return dist / denom if dist <= cutoff else bound
+
     def _normalize_ipa_for_distance(self, ipa: str) -> str:
         """
         將 IPA 正規化成適合距離計算的形式。
@@ -109,11 +145,7 @@ class EnglishPhoneticSystem(PhoneticSystem):
         - 去除空白與長音符號（ː）
         - 統一一些 IPA 表示差異（例如 ɚ/ɝ -> ə，ɡ -> g）
         """
-        ipa = (ipa or "").replace(" ", "")
-        ipa = ipa.replace("ː", "")
-        ipa = ipa.replace("ɚ", "ə").replace("ɝ", "ə")
-        ipa = ipa.replace("ɡ", "g")
-        return ipa
+        return (ipa or "").translate(_IPA_DISTANCE_TABLE)
 
     def _map_to_phoneme_groups(self, ipa: str) -> str:
         """
@@ -122,16 +154,9 @@ class EnglishPhoneticSystem(PhoneticSystem):
         說明：
         - EnglishPhoneticConfig.FUZZY_PHONEME_GROUPS 定義了相近音的群組
         - 把同群組音素映射成同一代碼（A/B/C...），可提高模糊匹配的召回率
+        - 對照表在模組載入時預先建立，單次 translate 即完成映射
         """
-        mapped: list[str] = []
-        for ch in ipa:
-            code = None
-            for idx, group in enumerate(EnglishPhoneticConfig.FUZZY_PHONEME_GROUPS):
-                if ch in group:
-                    code = chr(ord("A") + idx)
-                    break
-            mapped.append(code if code is not None else ch)
-        return "".join(mapped)
+        return ipa.translate(_PHONEME_GROUP_TABLE)
 
     def _consonant_skeleton(self, ipa: str) -> str:
         """
@@ -11,6 +11,7 @@
 
 from __future__ import annotations
 
+from itertools import chain
 from typing import Any
 
 from . import indexing as indexing_ops
@@ -134,14 +135,8 @@ def generate_fuzzy_candidate_drafts(
     if not tokens:
         return []
 
-    seen: set[str] = set()
-    unique_tokens: list[str] = []
-    for token in tokens:
-        if token not in seen:
-            seen.add(token)
-            unique_tokens.append(token)
-
-    token_phonetic_map = {t: phonetic.to_phonetic(t) for t in unique_tokens}
+    # dict.fromkeys：單次走訪完成保序去重
+    token_phonetic_map = {t: phonetic.to_phonetic(t) for t in dict.fromkeys(tokens)}
     token_phonetics = [token_phonetic_map.get(t, "") for t in tokens]
 
     drafts: list[JapaneseCandidateDraft] = []
@@ -172,9 +167,11 @@ def generate_fuzzy_candidate_drafts(
             window_group_key = -1 if window_first_group is None else int(window_first_group)
 
             # 只看同群組 + unknown 群組；視窗首音未知時保守掃描所有群組
-            items = list(groups.get(window_group_key, [])) + list(groups.get(-1, []))
+            # 直接迭代 bucket 內的 list，不為每個 window 複製/串接一份新的 items
             if window_group_key == -1:
-                items = [it for bucket in groups.values() for it in bucket]
+                items = chain.from_iterable(groups.values())
+            else:
+                items = chain(groups.get(window_group_key, ()), groups.get(-1, ()))
 
             for item in items:
                 # 長度差上限 pruning：避免拿非常不可能的 item 進 similarity
@@ -9,7 +9,9 @@
 
 from __future__ import annotations
 
+import heapq
 import itertools
+import re
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -18,8 +20,11 @@ from phonofix.backend import JapanesePhoneticBackend, get_japanese_backend
 
 from .config import JapanesePhoneticConfig
 
+# 假名（平/片）與常用漢字區段；預先編譯，由 _sre 在 C 層掃描並於首次命中即返回
+_JAPANESE_SCRIPT_RE = re.compile(r"[\u3040-\u30ff\u4e00-\u9fff]")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class _Candidate:
     """
     內部候選資料結構（用於 variants 去重與排序）。
@@ -35,6 +40,11 @@ class _Candidate:
     key: str
 
 
+# 平/片假名互轉對照表（ァ..ヶ <-> ぁ..ゖ，碼位差 0x60），模組載入時建立一次
+_KATA_TO_HIRA_TABLE = {cp: cp - 0x60 for cp in range(0x30A1, 0x30F7)}
+_HIRA_TO_KATA_TABLE = {cp: cp + 0x60 for cp in range(0x3041, 0x3097)}
+
+
 def _kata_to_hira(text: str) -> str:
     """
     將片假名轉為平假名（僅轉換假名字元，其他字元保持不變）。
@@ -43,13 +53,7 @@ def _kata_to_hira(text: str) -> str:
     - fugashi 的 reading 可能回傳片假名
     - 我們希望把 reading 先統一成平假名，降低後續變體生成的分支
     """
-    hira = []
-    for ch in text:
-        if "\u30a1" <= ch <= "\u30f6":
-            hira.append(chr(ord(ch) - 0x60))
-        else:
-            hira.append(ch)
-    return "".join(hira)
+    return text.translate(_KATA_TO_HIRA_TABLE)
 
 
 def _hira_to_kata(text: str) -> str:
@@ -59,13 +63,7 @@ def _hira_to_kata(text: str) -> str:
     用途：
     - 產生「書寫系統差異」的 surface variants（平/片 假名）
     """
-    kata = []
-    for ch in text:
-        if "\u3041" <= ch <= "\u3096":
-            kata.append(chr(ord(ch) + 0x60))
-        else:
-            kata.append(ch)
-    return "".join(kata)
+    return text.translate(_HIRA_TO_KATA_TABLE)
 
 
 def _has_japanese_script(text: str) -> bool:
@@ -75,9 +73,7 @@ def _has_japanese_script(text: str) -> bool:
     用途：
     - 決定 term 是「需要轉讀音/romaji」的日文文本，或已是 romaji/mixed
     """
-    return any(
-        ("\u3040" <= ch <= "\u30ff") or ("\u4e00" <= ch <= "\u9fff") for ch in text
-    )
+    return _JAPANESE_SCRIPT_RE.search(text) is not None
 
 
 def _normalize_romaji(romaji: str, config: type[JapanesePhoneticConfig]) -> str:
@@ -140,8 +136,13 @@ def _romaji_variants(base: str, config: type[JapanesePhoneticConfig], *, max_sta
                         next_states[v] = min(next_states.get(v, 10**9), c + cost)
 
         if len(next_states) > max_states:
-            ranked = sorted(next_states.items(), key=lambda kv: (kv[1], len(kv[0]), kv[0]))
-            next_states = dict(ranked[:max_states])
+            # 只保留前 max_states 名：nsmallest 取 top-k（結果與 sorted()[:k] 相同）
+            ranked = heapq.nsmallest(
+                max_states,
+                next_states.items(),
+                key=lambda kv: (kv[1], len(kv[0]), kv[0]),
+            )
+            next_states = dict(ranked)
         states = next_states
 
     ranked = sorted(states.items(), key=lambda kv: (kv[1], len(kv[0]), kv[0]))
@@ -195,7 +196,7 @@ class JapaneseFuzzyGenerator(FuzzyGeneratorProtocol):
         - 這裡生成的是「表面字串」變體，最終仍以 phonetic key 去重與比對
         - 變體數量受 `max_variants` 與 `max_phonetic_states` 控制，避免膨脹
         """
-        if not term:
+        if not term or term.isspace():
             return []
 
         max_variants = max(0, int(max_variants))
@@ -240,8 +241,12 @@ class JapaneseFuzzyGenerator(FuzzyGeneratorProtocol):
             if prev is None or cand.cost < prev.cost or (cand.cost == prev.cost and cand.text < prev.text):
                 best_by_key[key] = cand
 
-        ranked = sorted(best_by_key.values(), key=lambda c: (c.cost, len(c.text), c.text))
-        return [c.text for c in ranked][:max_variants]
+        ranked = heapq.nsmallest(
+            max_variants,
+            best_by_key.values(),
+            key=lambda c: (c.cost, len(c.text), c.text),
+        )
+        return [c.text for c in ranked]
 
     def _to_hiragana_reading(self, text: str) -> str:
         """
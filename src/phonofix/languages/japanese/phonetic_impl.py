@@ -6,14 +6,46 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Tuple
 
+import Levenshtein
+
 from phonofix.core.phonetic_interface import PhoneticSystem
 from phonofix.backend import JapanesePhoneticBackend, get_japanese_backend
 
 from .config import JapanesePhoneticConfig
 
 
+@lru_cache(maxsize=50000)
+def _normalize_phonetic_cached(phonetic: str) -> str:
+    """
+    正規化羅馬拼音（模組層級快取版）。
+
+    fuzzy 掃描時每個 window 都會與多個 item 比對，同一 romaji 會被反覆正規化；
+    規則只依賴 JapanesePhoneticConfig 的類別常數，因此可安全地以字串為 key 快取。
+    """
+    normalized = phonetic
+
+    # 1. 羅馬字變體標準化
+    for variant, standard in JapanesePhoneticConfig.ROMANIZATION_VARIANTS.items():
+        normalized = normalized.replace(variant, standard)
+
+    # 2. 長音縮短
+    for long_vowel, short_vowel in JapanesePhoneticConfig.FUZZY_LONG_VOWELS.items():
+        normalized = normalized.replace(long_vowel, short_vowel)
+
+    # 3. 促音簡化
+    for geminated, single in JapanesePhoneticConfig.FUZZY_GEMINATION.items():
+        normalized = normalized.replace(geminated, single)
+
+    # 4. 鼻音標準化
+    for nasal_variant, standard in JapanesePhoneticConfig.FUZZY_NASALS.items():
+        normalized = normalized.replace(nasal_variant, standard)
+
+    return normalized
+
+
 class JapanesePhoneticSystem(PhoneticSystem):
     """
     日文發音系統
@@ -58,8 +90,6 @@ class JapanesePhoneticSystem(PhoneticSystem):
             error_ratio: 0.0 ~ 1.0 (越低越相似)
             is_fuzzy_match: 是否通過模糊匹配閾值
         """
-        import Levenshtein
-
         # 1. 正規化
         norm1 = self._normalize_phonetic(phonetic1)
         norm2 = self._normalize_phonetic(phonetic2)
@@ -84,26 +114,10 @@ class JapanesePhoneticSystem(PhoneticSystem):
         2. 長音縮短 (aa -> a, ou -> o)
         3. 促音簡化 (kk -> k)
         4. 鼻音標準化 (mb -> nb)
-        """
-        normalized = phonetic
-
-        # 1. 羅馬字變體標準化
-        for variant, standard in JapanesePhoneticConfig.ROMANIZATION_VARIANTS.items():
-            normalized = normalized.replace(variant, standard)
 
-        # 2. 長音縮短
-        for long_vowel, short_vowel in JapanesePhoneticConfig.FUZZY_LONG_VOWELS.items():
-            normalized = normalized.replace(long_vowel, short_vowel)
-
-        # 3. 促音簡化
-        for geminated, single in JapanesePhoneticConfig.FUZZY_GEMINATION.items():
-            normalized = normalized.replace(geminated, single)
-
-        # 4. 鼻音標準化
-        for nasal_variant, standard in JapanesePhoneticConfig.FUZZY_NASALS.items():
-            normalized = normalized.replace(nasal_variant, standard)
-
-        return normalized
+        結果由模組層級 lru_cache 共用（見 `_normalize_phonetic_cached`）。
+        """
+        return _normalize_phonetic_cached(phonetic)
 
     def are_fuzzy_similar(self, phonetic1: str, phonetic2: str) -> bool:
         """
@@ -0,0 +1,46 @@
+"""
+pytest 共用設定
+"""
+
+from __future__ import annotations
+
+import importlib.util
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    收集到英文測試時，於背景預熱英文 backend（espeak-ng）。
+
+    - 使用 backend 既有的 `initialize_lazy()`，初始化與其他測試的執行重疊進行
+    - 只選中文/日文測試時不預熱，避免無謂載入 phonemizer/espeak-ng
+    - pytest-xdist 的 controller 不執行測試，不預熱（由各 worker 自行預熱）
+    - 只以 `find_spec("phonemizer")` 判斷是否安裝，不呼叫 `is_phonemizer_available()`：
+      後者會在 `initialize()` 設定 espeak 路徑（Windows）之前就探測並快取「不可用」結果，
+      導致之後整個 session 的英文測試都失敗；espeak-ng 本身不可用時，失敗會記錄在 backend 的 lazy_init 狀態
+    """
+    if getattr(config.option, "numprocesses", None) and not hasattr(config, "workerinput"):
+        return
+    if not any("english" in item.nodeid.lower() for item in items):
+        return
+
+    if importlib.util.find_spec("phonemizer") is None:
+        return
+
+    from phonofix.backend.english_backend import get_english_backend
+
+    get_english_backend().initialize_lazy()
+
+
+@pytest.fixture(scope="session")
+def japanese_engine():
+    """
+    整個測試 session 共用的預設 JapaneseEngine。
+
+    - cutlet/fugashi 由 backend 單例管理，但 Engine 內的 phonetic/tokenizer/generator 仍可共用
+    - 只給「使用預設設定」的測試使用；需要特殊參數的測試請自行建立 Engine
+    """
+    from phonofix import JapaneseEngine
+
+    return JapaneseEngine()
@@ -9,10 +9,11 @@ from phonofix import ChineseEngine
 class TestChineseCorrector:
     """中文替換器基本功能測試"""
 
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """設置 Engine (所有測試共享)"""
-        self.engine = ChineseEngine()
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def setup(cls):
+        """設置 Engine（整個測試類別共用一個 Engine；Engine 建立後不再變動，corrector 狀態各自獨立）"""
+        cls.engine = ChineseEngine()
 
     def test_basic_substitution(self):
         """測試基本替換功能"""
@@ -86,6 +87,7 @@ class TestChineseCorrector:
 
         result = corrector.correct("")
         assert result == ""
+        assert corrector.correct("  \n ") == "  \n "
 
     def test_no_match(self):
         """測試無匹配情況"""
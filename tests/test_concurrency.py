@@ -8,8 +8,30 @@
 
 from concurrent.futures import ThreadPoolExecutor
 
+import pytest
 
-def test_backend_singletons_are_threadsafe():
+
+@pytest.fixture
+def fresh_backends(monkeypatch):
+    """
+    讓三個語言的 backend 單例從「尚未建立」狀態開始。
+
+    conftest 可能已在背景預熱英文 backend；不重置的話，下面的測試就不會競爭建立/首次初始化。
+    重置前先等待既有的背景初始化結束，避免兩個 espeak-ng 首次載入同時進行。
+    monkeypatch 在測試結束後還原原本的單例，不影響其他測試共用的快取。
+    """
+    from phonofix.backend import chinese_backend, english_backend, japanese_backend
+
+    current = english_backend._instance
+    warmup_thread = current._lazy_init_thread if current is not None else None
+    if warmup_thread is not None:
+        warmup_thread.join()
+
+    for module in (english_backend, chinese_backend, japanese_backend):
+        monkeypatch.setattr(module, "_instance", None)
+
+
+def test_backend_singletons_are_threadsafe(fresh_backends):
     from phonofix.backend import get_chinese_backend, get_english_backend, get_japanese_backend
 
     def _get_ids(_):
@@ -26,7 +48,7 @@ def test_backend_singletons_are_threadsafe():
     assert len(japanese_ids) == 1
 
 
-def test_backend_initialize_is_threadsafe():
+def test_backend_initialize_is_threadsafe(fresh_backends):
     from phonofix.backend import get_chinese_backend, get_english_backend, get_japanese_backend
 
     english = get_english_backend()
@@ -4,6 +4,10 @@ Engine 層測試模組
 測試新的三層架構：Backend → Engine → Corrector
 """
 
+import pytest
+
+from phonofix.backend import get_chinese_backend, get_english_backend, get_japanese_backend
+
 
 class TestEnglishEngine:
     """英文引擎測試"""
@@ -94,30 +98,15 @@ class TestChineseEngine:
 class TestBackendSingleton:
     """Backend 單例測試"""
 
-    def test_english_backend_singleton(self):
-        """測試英文 Backend 單例"""
-        from phonofix.backend import get_english_backend
-
-        backend1 = get_english_backend()
-        backend2 = get_english_backend()
-
-        assert backend1 is backend2
-
-    def test_chinese_backend_singleton(self):
-        """測試中文 Backend 單例"""
-        from phonofix.backend import get_chinese_backend
-
-        backend1 = get_chinese_backend()
-        backend2 = get_chinese_backend()
-
-        assert backend1 is backend2
-
-    def test_japanese_backend_singleton(self):
-        """測試日文 Backend 單例"""
-        from phonofix.backend import get_japanese_backend
-
-        backend1 = get_japanese_backend()
-        backend2 = get_japanese_backend()
+    @pytest.mark.parametrize(
+        "get_backend",
+        [get_english_backend, get_chinese_backend, get_japanese_backend],
+        ids=["english", "chinese", "japanese"],
+    )
+    def test_backend_singleton(self, get_backend):
+        """測試各語言 Backend 單例（英文/中文/日文）"""
+        backend1 = get_backend()
+        backend2 = get_backend()
 
         assert backend1 is backend2
 
@@ -9,14 +9,23 @@ from phonofix import EnglishEngine
 class TestEnglishCorrector:
     """英文替換器基本功能測試"""
 
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """設置 Engine (所有測試共享，Backend 單例模式)"""
-        self.engine = EnglishEngine()
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def setup(cls):
+        """設置 Engine（整個測試類別共用一個 Engine，Backend 單例模式）"""
+        cls.engine = EnglishEngine()
+        cls._correctors = {}
+
+    def corrector_for(self, terms):
+        """取得純詞彙清單的 corrector（相同詞彙組合在類別內重用，避免重複產生變體）"""
+        key = tuple(terms)
+        if key not in self._correctors:
+            self._correctors[key] = self.engine.create_corrector(list(key))
+        return self._correctors[key]
 
     def test_basic_substitution(self):
         """測試基本替換功能"""
-        corrector = self.engine.create_corrector(["Python", "TensorFlow"])
+        corrector = self.corrector_for(["Python", "TensorFlow"])
 
         result = corrector.correct("I use Pyton and Ten so floor")
         assert "Python" in result
@@ -24,14 +33,14 @@ class TestEnglishCorrector:
 
     def test_split_word_matching(self):
         """測試分詞匹配 (ASR 常見錯誤)"""
-        corrector = self.engine.create_corrector(["JavaScript"])
+        corrector = self.corrector_for(["JavaScript"])
 
         result = corrector.correct("I love java script")
         assert result == "I love JavaScript"
 
     def test_acronym_matching(self):
         """測試縮寫匹配"""
-        corrector = self.engine.create_corrector(["AWS", "GCP"])
+        corrector = self.corrector_for(["AWS", "GCP"])
 
         result = corrector.correct("I use A W S and G C P")
         assert "AWS" in result
@@ -40,7 +49,7 @@ class TestEnglishCorrector:
     def test_framework_names(self):
         """測試框架名稱"""
         terms = ["PyTorch", "NumPy", "Pandas", "Django"]
-        corrector = self.engine.create_corrector(terms)
+        corrector = self.corrector_for(terms)
 
         assert "PyTorch" in corrector.correct("Pie torch is great")
         assert "NumPy" in corrector.correct("I use Num pie")
@@ -49,7 +58,7 @@ class TestEnglishCorrector:
 
     def test_dotted_names(self):
         """測試帶點的名稱 (如 Vue.js)"""
-        corrector = self.engine.create_corrector(["Vue.js", "Node.js"])
+        corrector = self.corrector_for(["Vue.js", "Node.js"])
 
         result = corrector.correct("I use View JS and No JS")
         assert "Vue.js" in result
@@ -63,21 +72,22 @@ class TestEnglishCorrector:
 
     def test_case_insensitive(self):
         """測試大小寫不敏感"""
-        corrector = self.engine.create_corrector(["Python"])
+        corrector = self.corrector_for(["Python"])
 
         result = corrector.correct("pyton is great")
         assert "Python" in result
 
     def test_empty_input(self):
         """測試空輸入"""
-        corrector = self.engine.create_corrector(["Python"])
+        corrector = self.corrector_for(["Python"])
 
         result = corrector.correct("")
         assert result == ""
+        assert corrector.correct("  \n ") == "  \n "
 
     def test_no_match(self):
         """測試無匹配情況"""
-        corrector = self.engine.create_corrector(["Python"])
+        corrector = self.corrector_for(["Python"])
 
         result = corrector.correct("The weather is nice today")
         assert result == "The weather is nice today"
@@ -12,9 +12,25 @@
 
 from __future__ import annotations
 
+import pytest
+
 from phonofix.core.protocols.corrector import CorrectorProtocol
 
 
+@pytest.fixture(scope="module")
+def standalone_generators():
+    """
+    模組共用的預設建構 fuzzy generator（不經過 Engine）。
+
+    - 覆蓋 `EnglishFuzzyGenerator()` / `JapaneseFuzzyGenerator()` 的公開用法（backend=None，使用時才取得 backend 單例）
+    - 每種語言只建構一次，供各契約測試共用
+    """
+    from phonofix.languages.english.fuzzy_generator import EnglishFuzzyGenerator
+    from phonofix.languages.japanese.fuzzy_generator import JapaneseFuzzyGenerator
+
+    return {"english": EnglishFuzzyGenerator(), "japanese": JapaneseFuzzyGenerator()}
+
+
 class TestLanguageContracts:
     def test_chinese_contracts(self):
         from phonofix import ChineseEngine
@@ -36,8 +52,10 @@ class TestLanguageContracts:
         variants = engine.fuzzy_generator.generate_variants("台北車站", max_variants=10)
         assert isinstance(variants, list)
         assert all(isinstance(v, str) for v in variants)
+        # 純空白輸入不產生變體
+        assert engine.fuzzy_generator.generate_variants("  ") == []
 
-    def test_english_contracts(self):
+    def test_english_contracts(self, standalone_generators):
         from phonofix import EnglishEngine
         from phonofix.languages.english.fuzzy_generator import EnglishFuzzyGenerator
         from phonofix.languages.english.tokenizer import EnglishTokenizer
@@ -55,17 +73,17 @@ class TestLanguageContracts:
         assert all(isinstance(t, str) for t in tokens)
         assert all(isinstance(p, tuple) and len(p) == 2 for p in indices)
 
-        fuzzy = EnglishFuzzyGenerator()
-        variants = fuzzy.generate_variants("Python", max_variants=10)
+        variants = standalone_generators["english"].generate_variants("Python", max_variants=10)
         assert isinstance(variants, list)
         assert all(isinstance(v, str) for v in variants)
+        # 純空白輸入不產生變體（含較激進的 representative variants）
+        assert standalone_generators["english"].generate_variants("  ") == []
+        assert EnglishFuzzyGenerator(enable_representative_variants=True).generate_variants("  ") == []
 
-    def test_japanese_contracts(self):
-        from phonofix import JapaneseEngine
-        from phonofix.languages.japanese.fuzzy_generator import JapaneseFuzzyGenerator
+    def test_japanese_contracts(self, japanese_engine, standalone_generators):
         from phonofix.languages.japanese.tokenizer import JapaneseTokenizer
 
-        engine = JapaneseEngine()
+        engine = japanese_engine
         corrector = engine.create_corrector({"アスピリン": ["asupirin"]})
 
         assert isinstance(corrector, CorrectorProtocol)
@@ -78,7 +96,8 @@ class TestLanguageContracts:
         assert all(isinstance(t, str) for t in tokens)
         assert all(isinstance(p, tuple) and len(p) == 2 for p in indices)
 
-        fuzzy = JapaneseFuzzyGenerator()
-        variants = fuzzy.generate_variants("アスピリン", max_variants=10)
+        variants = standalone_generators["japanese"].generate_variants("アスピリン", max_variants=10)
         assert isinstance(variants, list)
         assert all(isinstance(v, str) for v in variants)
+        # 純空白輸入不產生變體
+        assert standalone_generators["japanese"].generate_variants("  ") == []
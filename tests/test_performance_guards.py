@@ -8,6 +8,19 @@
 
 from __future__ import annotations
 
+import itertools
+
+# DummyEnglishBackend 的 IPA 輸出表：首字母 -> 固定長度 IPA（長度固定，避免長度差 pruning 影響測試）
+_DUMMY_IPA_TABLE = {c: c + "aaaa" for c in "pbtdkgfvszmnlrwiua"}
+_DUMMY_DEFAULT_IPA = "paaaa"
+
+# 中文分桶測試的干擾詞（皆不在 n_l_group），模組載入時建立一次並以 tuple 固定
+_CHINESE_NOISE_TERMS = tuple(
+    p + s
+    for p in ("中", "車", "山", "資", "發", "花", "工", "北", "大", "是")
+    for s in ("站", "票", "園", "國", "學")
+)
+
 
 class DummyEnglishBackend:
     """
@@ -16,6 +29,9 @@ class DummyEnglishBackend:
     - 讓 IPA 首音素可控，便於測試首音素分桶 pruning
     """
 
+    # 欄位固定（狀態 + 兩個 int 計數器），以 __slots__ 取代實例 __dict__
+    __slots__ = ("_initialized", "_hits", "_misses")
+
     def __init__(self):
         self._initialized = True
         self._hits = 0
@@ -48,19 +64,16 @@ class DummyEnglishBackend:
 
     @staticmethod
     def _ipa_for(text: str) -> str:
-        # 以第一個字母決定首音素群組；長度固定，避免長度差 pruning 影響測試。
-        first = (text or "p")[0].lower()
-        if first in {"p", "b", "t", "d", "k", "g", "f", "v", "s", "z", "m", "n", "l", "r", "w", "i", "u", "a"}:
-            return first + "aaaa"
-        return "paaaa"
+        # 以第一個字母決定首音素群組（查預先建立的輸出表）。
+        return _DUMMY_IPA_TABLE.get((text or "p")[0].lower(), _DUMMY_DEFAULT_IPA)
 
     def to_phonetic(self, text: str) -> str:
         self._misses += 1
         return self._ipa_for(text)
 
     def to_phonetic_batch(self, texts: list):
-        self._misses += max(0, len(texts))
-        return {t: self._ipa_for(t) for t in texts}
+        self._misses += len(texts)
+        return dict(zip(texts, map(self._ipa_for, texts)))
 
 
 def test_english_group_pruning_limits_similarity_calls(monkeypatch):
@@ -88,10 +101,11 @@ def test_english_group_pruning_limits_similarity_calls(monkeypatch):
 
     corrector = engine.create_corrector(terms)
 
-    calls = {"n": 0}
+    # 呼叫計數：每次呼叫 next(calls) 遞增；結束後 next(calls) 的回傳值即為累計呼叫次數
+    calls = itertools.count()
 
     def _counting_similarity(a, b):
-        calls["n"] += 1
+        next(calls)
         # 這裡刻意讓它永遠不 match，避免產生大量候選影響其他邏輯
         return 1.0, False
 
@@ -101,7 +115,106 @@ def test_english_group_pruning_limits_similarity_calls(monkeypatch):
 
     # 若分桶有效，理論上只需要對 'p' 群組的 30 個項目計算。
     # 這裡用寬鬆上限避免內部索引微調造成脆弱。
-    assert calls["n"] <= 40
+    assert next(calls) <= 40
+
+
+class SpellingEnglishBackend(DummyEnglishBackend):
+    """
+    以拼寫本身當作 IPA 的測試 backend：
+    - 不同拼寫不會在 IPA 去重時被合併，變體數量與 max_variants 截斷才看得出差異
+    """
+
+    __slots__ = ()
+
+    def to_phonetic(self, text: str) -> str:
+        self._misses += 1
+        return text
+
+    def to_phonetic_batch(self, texts: list):
+        self._misses += len(texts)
+        return {text: text for text in texts}
+
+
+def test_english_variants_batch_uses_single_ipa_call(monkeypatch):
+    """
+    英文批次變體生成應只呼叫一次 backend 批次 IPA 轉換，且每個詞彙的結果與逐詞生成的既有輸出相同。
+    """
+    from phonofix.languages.english.fuzzy_generator import EnglishFuzzyGenerator
+
+    generator = EnglishFuzzyGenerator(backend=SpellingEnglishBackend())
+    terms = ["TensorFlow", "AWS", "node_js", "Vue.js", "PyTorch"]
+
+    calls = itertools.count()
+    batch_ipa = SpellingEnglishBackend.to_phonetic_batch
+
+    def _counting_batch(self, texts):
+        next(calls)
+        return batch_ipa(self, texts)
+
+    # backend 使用 __slots__，只能在類別層級替換方法
+    monkeypatch.setattr(SpellingEnglishBackend, "to_phonetic_batch", _counting_batch)
+
+    assert generator.generate_variants_batch(terms, max_variants=3) == {
+        "TensorFlow": ["tensorflow", "Tensor Flow"],
+        "AWS": ["aws", "A W S", "A.W.S."],
+        "node_js": ["node js"],
+        "Vue.js": ["Vue js", "vue.js", "vue js"],
+        "PyTorch": ["pytorch", "Py Torch"],
+    }
+    assert next(calls) == 1
+
+
+def test_english_engine_batches_auto_variants_by_max_variants(monkeypatch):
+    """
+    EnglishEngine 應依各詞彙的 max_variants 分組批次產生 auto variants：
+    - 每個 max_variants 分組只呼叫一次 generate_variants_batch
+    - max_variants 為 0 視為預設 30；dict 未提供 aliases 時視為空 aliases
+    - 產生的 aliases 與逐詞生成時相同
+    """
+    monkeypatch.setattr(
+        "phonofix.languages.english.engine.get_english_backend",
+        lambda: SpellingEnglishBackend(),
+    )
+
+    from phonofix import EnglishEngine
+
+    engine = EnglishEngine(enable_surface_variants=True)
+
+    batches = []
+    batch_variants = engine.fuzzy_generator.generate_variants_batch
+
+    def _recording_batch(terms, max_variants=30):
+        batches.append((sorted(terms), max_variants))
+        return batch_variants(terms, max_variants=max_variants)
+
+    monkeypatch.setattr(engine.fuzzy_generator, "generate_variants_batch", _recording_batch)
+
+    corrector = engine.create_corrector(
+        {
+            "TensorFlow": ["Ten so floor"],
+            "AWS": {"max_variants": 2},
+            "node_js": {"aliases": [], "max_variants": 0},
+            "PyTorch": {"keywords": ["ml"], "max_variants": 2},
+            "GitHub": [],
+        }
+    )
+
+    assert sorted(batches) == [
+        (["AWS", "PyTorch"], 2),
+        (["GitHub", "TensorFlow", "node_js"], 30),
+    ]
+    assert corrector.term_mapping == {
+        "Ten so floor": "TensorFlow",
+        "tensorflow": "TensorFlow",
+        "Tensor Flow": "TensorFlow",
+        "aws": "AWS",
+        "A W S": "AWS",
+        "node js": "node_js",
+        "pytorch": "PyTorch",
+        "Py Torch": "PyTorch",
+        "github": "GitHub",
+        "Git Hub": "GitHub",
+    }
 
 
 def test_chinese_initials_bucket_prunes_items(monkeypatch):
@@ -113,16 +226,13 @@ def test_chinese_initials_bucket_prunes_items(monkeypatch):
     engine = ChineseEngine(enable_surface_variants=False)
 
     keep_terms = ["牛奶", "流奶"]  # n / l -> n_l_group
-    noise_prefixes = ["中", "車", "山", "資", "發", "花", "工", "北", "大", "是"]
-    noise_suffixes = ["站", "票", "園", "國", "學"]
-    noise_terms = [p + s for p in noise_prefixes for s in noise_suffixes]
 
-    corrector = engine.create_corrector(keep_terms + noise_terms)
+    corrector = engine.create_corrector([*keep_terms, *_CHINESE_NOISE_TERMS])
 
-    calls = {"n": 0}
+    calls = itertools.count()
 
     def _counting_process(*args, **kwargs):
-        calls["n"] += 1
+        next(calls)
         return None
 
     monkeypatch.setattr("phonofix.languages.chinese.candidates.process_fuzzy_match_draft", _counting_process)
@@ -132,7 +242,7 @@ def test_chinese_initials_bucket_prunes_items(monkeypatch):
     corrector._exact_items_by_alias = {}
 
     assert corrector.correct("流奶", silent=True) == "流奶"
-    assert calls["n"] == 2
+    assert next(calls) == 2
 
 
 def test_japanese_group_pruning_limits_similarity_calls(monkeypatch):
@@ -150,13 +260,13 @@ def test_japanese_group_pruning_limits_similarity_calls(monkeypatch):
     ]
     corrector = engine.create_corrector(keep_terms + noise_terms)
 
-    calls = {"n": 0}
+    calls = itertools.count()
 
     def _counting_similarity(a, b):
-        calls["n"] += 1
+        next(calls)
         return 1.0, False
 
     monkeypatch.setattr(corrector.phonetic, "calculate_similarity_score", _counting_similarity)
 
     assert corrector.correct("パンダ", silent=True) == "パンダ"
-    assert calls["n"] == 2
+    assert next(calls) == 2